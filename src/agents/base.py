@@ -1,7 +1,9 @@
 from dataclasses import dataclass
 from typing import Protocol
 
-@dataclass
+# slots=True drops the per-instance __dict__ (smaller, faster attribute
+# access); frozen=True keeps responses safely shareable across caches.
+@dataclass(slots=True, frozen=True)
 class AgentResponse:
     answer: str
     agent_name: str
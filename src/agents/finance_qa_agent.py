@@ -1,49 +1,286 @@
+import asyncio
+import functools
+import hashlib
 import os
+import threading
+import weakref
+from typing import AsyncIterator, Iterator
 
-from openai import OpenAI
+from openai import AsyncOpenAI
 from src.agents.base import AgentResponse
 from src.rag.retriever import Retriever
+from src.utils.cache import TTLCache
+from src.utils.semantic_cache import SemanticCache
+
+try:
+    import tiktoken
+except ImportError:
+    # Optional: without it the token budget falls back to a character
+    # estimate, which is close enough for trimming context.
+    tiktoken = None
 
 DISCLAIMER = (
     "Educational only — not financial advice. "
     "Consider a licensed financial professional for personalized guidance."
 )
 
+# Static parts of the system prompt, assembled once at import so each
+# request only formats the retrieved context into the middle.
+_INSTRUCTIONS_HEAD = (
+    "You are a helpful finance tutor for beginners. "
+    "Use simple language, define jargon, and give 1 short example. "
+    "Answer ONLY using the context below.\n"
+    "If the answer is not in the context, say you don’t know.\n\n"
+)
+_INSTRUCTIONS_TAIL = f"\n\nDisclaimer: {DISCLAIMER}"
+
+# LLM latency and cost scale with input tokens, so retrieved context is
+# trimmed to this budget before it goes into the prompt.
+_CONTEXT_TOKEN_BUDGET = 1500
+
+
+@functools.lru_cache(maxsize=4)
+def _token_encoder(model: str):
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def _count_tokens(text: str, model: str) -> int:
+    encoder = _token_encoder(model)
+    if encoder is None:
+        # ~4 characters per token is a serviceable estimate for English.
+        return len(text) // 4
+    return len(encoder.encode(text))
+
+# Cap in-flight OpenAI calls so a fan-out (asyncio.gather over agents or a
+# batch evaluation) stays under the API rate limit instead of thundering it.
+MAX_CONCURRENT_REQUESTS = 32
+
+# asyncio primitives bind to the loop they are first awaited on, so keep one
+# semaphore per event loop (sync callers get a fresh loop via asyncio.run).
+_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+# Exact-match response cache: repeat questions skip the LLM round-trip
+# entirely. Module level so every agent instance shares one cache.
+_response_cache = TTLCache(ttl=900)
+_response_cache_lock = threading.Lock()
+
+
+# Process-wide singletons: constructing an agent per request must not
+# re-pay TCP/TLS warmup for the client or the FAISS index build for the
+# retriever. lru_cache(maxsize=1) is thread-safe for the first call.
+@functools.lru_cache(maxsize=1)
+def _client() -> AsyncOpenAI:
+    return AsyncOpenAI()
+
+
+@functools.lru_cache(maxsize=1)
+def _retriever() -> Retriever:
+    return Retriever()
+
+
+# Semantic cache: paraphrased repeats of an answered question hit here,
+# skipping both the retriever and the LLM. 0.85 cosine is a
+# query-to-query paraphrase cutoff — distinct questions ("what is an
+# ETF?" vs "what is a bond?") land well below it, rewordings of the
+# same question above. Lower it via env to trade precision for hit rate.
+_SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.85"))
+_semantic_cache = SemanticCache(threshold=_SEMANTIC_CACHE_THRESHOLD, ttl=900)
+_semantic_cache_lock = threading.Lock()
+
+
+def _response_cache_key(model: str, instructions: str, user_message: str) -> bytes:
+    raw = "\x1f".join((model, instructions, user_message)).encode("utf-8")
+    return hashlib.blake2b(raw, digest_size=16).digest()
+
+
+def _request_semaphore() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        _semaphores[loop] = semaphore
+    return semaphore
+
+
+@functools.lru_cache(maxsize=1)
+def _background_loop() -> asyncio.AbstractEventLoop:
+    """Long-lived event loop that drives the sync entry points.
+
+    httpx binds pooled keep-alive connections to the loop they were
+    opened on, so spinning up a fresh loop per sync call (asyncio.run)
+    would break the shared AsyncOpenAI client as soon as a pooled
+    connection is reused — the second call within the keep-alive window
+    dies with "Event loop is closed". One daemon loop keeps the
+    connection pool valid for the life of the process.
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="finance-qa-loop", daemon=True).start()
+    return loop
+
+
 class FinanceQAAgent:
-    
+
     name : str = "FinanceQA_Agent"
-    
+
     def __init__(self, model: str | None = None):
-        self.client = OpenAI()
+        self.client = _client()
         # Favor a low-latency default model for chat UX.
         self.model = model or os.getenv("OPENAI_FINANCE_MODEL", "gpt-4o-mini")
-        self.retriever = Retriever()
+        self.retriever = _retriever()
+
+    async def arun(self, user_message: str) -> AgentResponse:
+        """Async entry point so an orchestrator can fan out agents concurrently."""
+        # One embedding serves both the semantic-cache lookup and the
+        # FAISS search below; the store memoizes it, so repeat queries
+        # hit the cache without any embedding round-trip at all.
+        query_vector = await asyncio.to_thread(self._embed_query, user_message)
+        if query_vector is not None:
+            with _semantic_cache_lock:
+                cached = _semantic_cache.get(query_vector)
+            if cached is not None:
+                return cached
+
+        retrieve_by_vector = getattr(self.retriever, "retrieve_by_vector", None)
+        if query_vector is not None and retrieve_by_vector is not None:
+            # Local FAISS search on the shared vector; no second embedding.
+            context_chunks = retrieve_by_vector(query_vector, top_k=5)
+        else:
+            aretrieve = getattr(self.retriever, "aretrieve", None)
+            if aretrieve is not None:
+                context_chunks = await aretrieve(user_message, top_k=5)
+            else:
+                context_chunks = self.retriever.retrieve(user_message, top_k=5)
+        context = self._build_context(context_chunks)
+        instructions = self._build_instructions(context)
+        cache_key = _response_cache_key(self.model, instructions, user_message)
+        with _response_cache_lock:
+            cached = _response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        async with _request_semaphore():
+            resp = await self.client.responses.create(
+                model=self.model,
+                instructions=instructions,
+                input=user_message,
+                max_output_tokens=300,
+            )
+        answer = self._with_disclaimer(resp.output_text.strip())
+
+        response = AgentResponse(
+            answer=answer,
+            agent_name=self.name,
+            confidence="high",
+            sources=["Investopedia"],
+        )
+        with _response_cache_lock:
+            _response_cache.set(cache_key, response)
+        if query_vector is not None:
+            with _semantic_cache_lock:
+                _semantic_cache.set(query_vector, response)
+        return response
 
     def run(self, user_message: str) -> AgentResponse:
+        """Thin sync wrapper for callers outside an event loop (CLI, graph nodes)."""
+        future = asyncio.run_coroutine_threadsafe(self.arun(user_message), _background_loop())
+        return future.result()
+
+    async def arun_stream(self, user_message: str) -> AsyncIterator[str]:
+        """Yield answer text deltas as they arrive from the model.
+
+        Total generation time is unchanged, but the caller can render the
+        first tokens immediately instead of waiting for the full answer.
+        The assembled answer is written to the exact-match cache at the
+        end so later non-streaming repeats still short-circuit.
+        """
         context_chunks = self.retriever.retrieve(user_message, top_k=5)
-        context = "\n\n".join(context_chunks)
-        instructions = (
-            "You are a helpful finance tutor for beginners. "
-            "Use simple language, define jargon, and give 1 short example. "
-            "Answer ONLY using the context below.\n"
-            "If the answer is not in the context, say you don’t know.\n\n"
-            f"Context:\n{context}\n\n"
-            f"Disclaimer: {DISCLAIMER}"
-        )
-        resp = self.client.responses.create(
-            model=self.model,
-            instructions=instructions,
-            input=user_message,
-            max_output_tokens=300,
-        )
-        answer = self._with_disclaimer(resp.output_text.strip())
-        
-        return AgentResponse(
+        context = self._build_context(context_chunks)
+        instructions = self._build_instructions(context)
+
+        pieces: list[str] = []
+        async with _request_semaphore():
+            async with self.client.responses.stream(
+                model=self.model,
+                instructions=instructions,
+                input=user_message,
+                max_output_tokens=300,
+            ) as stream:
+                async for event in stream:
+                    if event.type == "response.output_text.delta":
+                        pieces.append(event.delta)
+                        yield event.delta
+
+        streamed = "".join(pieces).strip()
+        answer = self._with_disclaimer(streamed)
+        # Emit the disclaimer tail if the model did not include one.
+        if len(answer) > len(streamed):
+            yield answer[len(streamed):]
+
+        response = AgentResponse(
             answer=answer,
             agent_name=self.name,
             confidence="high",
             sources=["Investopedia"],
         )
+        cache_key = _response_cache_key(self.model, instructions, user_message)
+        with _response_cache_lock:
+            _response_cache.set(cache_key, response)
+
+    def run_stream(self, user_message: str) -> Iterator[str]:
+        """Sync streaming wrapper: drives arun_stream on the shared loop."""
+        agen = self.arun_stream(user_message)
+        loop = _background_loop()
+        try:
+            while True:
+                try:
+                    yield asyncio.run_coroutine_threadsafe(agen.__anext__(), loop).result()
+                except StopAsyncIteration:
+                    break
+        finally:
+            asyncio.run_coroutine_threadsafe(agen.aclose(), loop).result()
+
+    def _build_context(self, context_chunks: list[str]) -> str:
+        """Join retrieved chunks, stopping once the token budget is spent.
+
+        The first chunk is always kept so the model has at least some
+        context to ground the answer in.
+        """
+        kept: list[str] = []
+        used = 0
+        for chunk in context_chunks:
+            cost = _count_tokens(chunk, self.model)
+            if kept and used + cost > _CONTEXT_TOKEN_BUDGET:
+                break
+            kept.append(chunk)
+            used += cost
+        return "\n\n".join(kept)
+
+    def _build_instructions(self, context: str) -> str:
+        return f"{_INSTRUCTIONS_HEAD}Context:\n{context}{_INSTRUCTIONS_TAIL}"
+
+    def _embed_query(self, user_message: str):
+        """Normalized query embedding via the store's memoized path.
+
+        Returns None when the retriever has no vector store (tests) or
+        the embedding call fails — the caller falls back to text-based
+        retrieval without the semantic cache.
+        """
+        store = getattr(self.retriever, "store", None)
+        if store is None:
+            return None
+        try:
+            return store.embed_query(user_message)
+        except Exception:
+            # Embedding failure should never take down the main QA path.
+            return None
 
     def _with_disclaimer(self, message: str) -> str:
         if "disclaimer:" in message.lower():
@@ -6,10 +6,11 @@ to reach a target future value using a standard future-value formula.
 
 from __future__ import annotations
 
-import json
 import math
 from typing import Any, Dict
 
+import orjson
+
 from src.agents.base import AgentResponse
 
 
@@ -52,7 +53,8 @@ class GoalAgent:
     def _parse_payload(self, user_message: str) -> Dict[str, Any] | None:
         """Parse strict JSON payload expected by this agent."""
         try:
-            parsed = json.loads(user_message)
+            # orjson parses str/bytes directly and is ~2-3x faster than stdlib json.
+            parsed = orjson.loads(user_message)
         except Exception:
             return None
         if not isinstance(parsed, dict):
@@ -110,7 +112,13 @@ class GoalAgent:
         months = max(1, int(round(years * 12)))
         monthly_rate = annual_return_decimal / 12.0
 
-        fv_of_current_savings = pv * ((1.0 + monthly_rate) ** months)
+        # (1 + i)^n where i=monthly_rate and n=months, computed once as
+        # exp(n * log1p(i)). Example: at 0.5% monthly for 120 months ->
+        # (1.005)^120 ~= 1.819, the compounding multiplier for $1 today.
+        log_growth = months * math.log1p(monthly_rate)
+        growth_factor = math.exp(log_growth)
+
+        fv_of_current_savings = pv * growth_factor
         fv_needed = fv - fv_of_current_savings
 
         if fv_needed <= 0:
@@ -119,15 +127,12 @@ class GoalAgent:
             # No investment growth case: just split the remaining target evenly.
             monthly_contribution = fv_needed / months
         else:
-            # (1 + i)^n where i=monthly_rate and n=months.
-            # Example: at 0.5% monthly for 120 months -> (1.005)^120 ~= 1.819.
-            # This is the compounding multiplier for $1 today. ( 1 growns to 1.819  in 120 months)
-            growth_factor = (1.0 + monthly_rate) ** months
-            annuity_factor = (growth_factor - 1.0) / monthly_rate
-            
             # Rearranged ordinary annuity formula (end-of-month contributions):
             # FV_needed = PMT * (((1 + i)^n - 1) / i)
             # PMT = FV_needed * i / ((1 + i)^n - 1)
+            # expm1 keeps the (1 + i)^n - 1 term accurate for tiny rates,
+            # where growth_factor - 1.0 would cancel to almost nothing.
+            annuity_factor = math.expm1(log_growth) / monthly_rate
             monthly_contribution = fv_needed / annuity_factor
 
         return {
@@ -153,25 +158,25 @@ class GoalAgent:
         monthly_contribution = result["monthly_contribution"]
         disclaimer_text = " ".join(DISCLAIMER.split())
 
-        lines = []
-        lines.append("### Goal Plan Summary")
-        lines.append("")
-        lines.append(f"**Required monthly contribution: ${monthly_contribution:,.2f}**")
-        lines.append("")
-        lines.append("**Inputs used**")
-        lines.append(f"- Target amount (FV): **${target_amount:,.2f}**")
-        lines.append(f"- Time horizon: **{years:g} years ({months} months)**")
-        lines.append(f"- Expected annual return: **{annual_return_pct:.2f}%**")
-        lines.append(f"- Current savings (PV): **${current_savings:,.2f}**")
-        lines.append("")
-        lines.append("**Projection details**")
-        lines.append(
-            f"- Future value of current savings at this return: **${fv_of_current_savings:,.2f}**"
+        # One f-string template instead of a list build + join; the text
+        # is identical and there are no intermediate allocations.
+        return (
+            "### Goal Plan Summary\n"
+            "\n"
+            f"**Required monthly contribution: ${monthly_contribution:,.2f}**\n"
+            "\n"
+            "**Inputs used**\n"
+            f"- Target amount (FV): **${target_amount:,.2f}**\n"
+            f"- Time horizon: **{years:g} years ({months} months)**\n"
+            f"- Expected annual return: **{annual_return_pct:.2f}%**\n"
+            f"- Current savings (PV): **${current_savings:,.2f}**\n"
+            "\n"
+            "**Projection details**\n"
+            f"- Future value of current savings at this return: **${fv_of_current_savings:,.2f}**\n"
+            "- Contribution timing assumed: **end of each month (ordinary annuity)**\n"
+            "\n"
+            f"_Disclaimer: {disclaimer_text}_"
         )
-        lines.append("- Contribution timing assumed: **end of each month (ordinary annuity)**")
-        lines.append("")
-        lines.append(f"_Disclaimer: {disclaimer_text}_")
-        return "\n".join(lines)
 
     def _normalize_annual_return(self, raw_rate: float) -> float | None:
         """Support both decimal and percent formats."""
@@ -10,6 +10,8 @@ from __future__ import annotations
 import re
 from typing import Dict, List, Optional
 
+import numpy as np
+import pandas as pd
 import yfinance as yf
 
 from src.agents.base import AgentResponse
@@ -19,6 +21,11 @@ DISCLAIMER = (
     "Educational only — not financial advice. Market data may be delayed or incomplete."
 )
 
+# Compiled once at import: ticker-looking token, optionally $-prefixed.
+# The message is uppercased before matching, so the character class stays
+# narrow and re.ASCII skips the Unicode tables.
+_TICKER_RE = re.compile(r"\$?([A-Z0-9]{1,5})", re.ASCII)
+
 
 class MarketAnalysisAgent:
     """Lightweight market lookup agent with a TTL cache."""
@@ -38,6 +45,10 @@ class MarketAnalysisAgent:
 
         # Store market lookups for ``ttl`` seconds to avoid repeat calls.
         self.cache = TTLCache(ttl=ttl)
+        # None lets yfinance use its own process-wide keep-alive session
+        # (curl_cffi browser impersonation when available) — replacing it
+        # with a plain requests session gets blocked by Yahoo. Injection
+        # stays available for tests.
         self._session = session
 
     # ------------------------------------------------------------------
@@ -96,6 +107,47 @@ class MarketAnalysisAgent:
             sources=["yfinance"],
         )
 
+    def run_many(self, tickers: List[str]) -> List[AgentResponse]:
+        """Answer a whole watchlist with one batched download.
+
+        Cache hits are served locally; every remaining ticker goes out in
+        a single ``yf.download`` call instead of one HTTP round-trip per
+        symbol, so wall time is one network round-trip for the batch.
+        """
+
+        normalized = [t.upper().strip() for t in tickers]
+
+        # Dict preserves order while deduplicating repeat symbols.
+        uncached = [t for t in dict.fromkeys(normalized) if self.cache.get(t) is None]
+        if uncached:
+            for ticker, market_data in self._download_batch(uncached).items():
+                self.cache.set(ticker, market_data)
+
+        responses: List[AgentResponse] = []
+        for ticker in normalized:
+            market_data = self.cache.get(ticker)
+            if market_data is None:
+                responses.append(
+                    AgentResponse(
+                        answer=self._with_disclaimer(
+                            f"I couldn't fetch data for {ticker} right now."
+                        ),
+                        agent_name=self.name,
+                        confidence="low",
+                        sources=["yfinance"],
+                    )
+                )
+                continue
+            responses.append(
+                AgentResponse(
+                    answer=self._with_disclaimer(self._format_answer(ticker, market_data)),
+                    agent_name=self.name,
+                    confidence="high",
+                    sources=["yfinance"],
+                )
+            )
+        return responses
+
     # ------------------------------------------------------------------
     # Helper methods
     # ------------------------------------------------------------------
@@ -107,12 +159,68 @@ class MarketAnalysisAgent:
         will match: ``AAPL``, ``$TSLA``, ``msft``.
         """
 
-        # Grab candidate tokens; keep it simple with a regex.
-        match = re.search(r"\$?([A-Za-z0-9]{1,5})", message)
+        # Grab candidate tokens; keep it simple with a precompiled regex.
+        match = _TICKER_RE.search(message.upper())
         if not match:
             return None
 
-        return match.group(1).upper()
+        return match.group(1)
+
+    def _download_batch(self, tickers: List[str]) -> Dict[str, Dict[str, object]]:
+        """Fetch recent closes for several tickers in one request.
+
+        Returns a mapping of ticker -> the same data dict shape that
+        ``_get_quote_and_history`` produces. The price falls back to the
+        latest close since fast_info is not available in batch mode.
+        Tickers with no usable history are simply absent from the result.
+        """
+
+        try:
+            history_df = yf.download(
+                tickers,
+                period="7d",
+                group_by="ticker",
+                threads=True,
+                progress=False,
+                session=self._session,
+            )
+        except Exception as e:
+            # Same quiet-failure policy as the single-ticker path.
+            print(f"Failed to fetch batch data for tickers {tickers}: {e}")
+            return {}
+
+        if history_df is None or history_df.empty:
+            return {}
+
+        batch: Dict[str, Dict[str, object]] = {}
+        for ticker in tickers:
+            try:
+                # With group_by='ticker' the columns are a (ticker, field)
+                # MultiIndex; a single ticker may come back flat.
+                if isinstance(history_df.columns, pd.MultiIndex):
+                    ticker_df = history_df[ticker]
+                else:
+                    ticker_df = history_df
+                closes = ticker_df["Close"].dropna().to_numpy(dtype=np.float64)
+            except (KeyError, TypeError):
+                continue
+
+            if closes.size == 0:
+                continue
+
+            last_5_closes = closes[-5:]
+            day_change_pct: Optional[float] = None
+            if last_5_closes.size >= 2 and last_5_closes[-2] != 0:
+                day_change_pct = float(
+                    np.round((last_5_closes[-1] / last_5_closes[-2] - 1.0) * 100, 2)
+                )
+
+            batch[ticker] = {
+                "price": round(float(last_5_closes[-1]), 2),
+                "day_change_pct": day_change_pct,
+                "last_5_closes": np.round(last_5_closes, 2).tolist(),
+            }
+        return batch
 
     def _get_quote_and_history(self, ticker: str) -> Optional[Dict[str, object]]:
         """Fetch current price and recent closes for ``ticker``.
@@ -124,10 +232,7 @@ class MarketAnalysisAgent:
         """
 
         try:
-            if self._session is None:
-                ticker_obj = yf.Ticker(ticker)
-            else:
-                ticker_obj = yf.Ticker(ticker, session=self._session)
+            ticker_obj = yf.Ticker(ticker, session=self._session)
 
             # Try fast_info first — it's the quickest path to the last price.
             fast_info = getattr(ticker_obj, "fast_info", {}) or {}
@@ -140,22 +245,23 @@ class MarketAnalysisAgent:
             # Pull a small window of history; 7d typically covers 5 trading days.
             history_df = ticker_obj.history(period="7d")
 
-            closes: List[float] = []
+            # Drop NaNs and stay in one float64 array end-to-end; the
+            # per-element Python float round-trips are gone.
+            closes = np.empty(0, dtype=np.float64)
             if history_df is not None and not history_df.empty and "Close" in history_df:
-                # Convert closes to plain floats and drop NaNs to stay defensive.
-                closes = [float(c) for c in history_df["Close"].dropna().tolist()]
-            last_5_closes: List[float] = closes[-5:]
+                closes = history_df["Close"].dropna().to_numpy(dtype=np.float64)
+            last_5_closes = closes[-5:]
 
             # If fast_info didn't give us a price, use the most recent close.
-            if price is None and last_5_closes:
-                price = last_5_closes[-1]
+            if price is None and last_5_closes.size:
+                price = float(last_5_closes[-1])
 
             # Compute day-over-day change when we have at least two closes.
             day_change_pct: Optional[float] = None
-            if len(last_5_closes) >= 2 and last_5_closes[-2] != 0:
-                latest = last_5_closes[-1]
-                prev = last_5_closes[-2]
-                day_change_pct = round(((latest - prev) / prev) * 100, 2)
+            if last_5_closes.size >= 2 and last_5_closes[-2] != 0:
+                day_change_pct = float(
+                    np.round((last_5_closes[-1] / last_5_closes[-2] - 1.0) * 100, 2)
+                )
 
             if price is None:
                 # Could not determine a price; signal failure.
@@ -164,7 +270,7 @@ class MarketAnalysisAgent:
             return {
                 "price": round(float(price), 2),
                 "day_change_pct": day_change_pct,
-                "last_5_closes": [round(float(c), 2) for c in last_5_closes],
+                "last_5_closes": np.round(last_5_closes, 2).tolist(),
             }
 
         except Exception as e:
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-import json
 import math
 from typing import Dict, List, Tuple
 
+import numpy as np
+import orjson
+
 from src.agents.base import AgentResponse
 
 
@@ -17,6 +19,37 @@ DISCLAIMER = (
 STOCK_KEYWORDS = {"VTI", "VOO", "VUG", "QQQ", "VXUS", "VEA", "VWO", "SPY", "TSLA", "AAPL", "MSFT", "AMZN", "GOOGL", "META", "NVDA", "JPM", "JNJ", "UNH", "HD", "PG", "DIS", "MA", "BAC", "V", "ADBE", "CMCSA", "NFLX"}
 BOND_KEYWORDS = {"BND", "BNDX", "AGG", "TLT", "IEF", "SHY", "MUB", "LQD", "HYG", "JNK"}
 
+# One precomputed ticker -> asset-class mapping so classification is a
+# single dict probe instead of two set membership tests per ticker.
+ASSET_CLASS: Dict[str, str] = {
+    **{t: "stock" for t in STOCK_KEYWORDS},
+    **{t: "bond" for t in BOND_KEYWORDS},
+}
+
+
+def _portfolio_kernel(values, is_stock, is_bond):
+    """Numeric core of _compute_metrics on plain arrays.
+
+    Kept free of Python objects so Numba can JIT-compile it when
+    available; the pure-NumPy fallback below runs the same code.
+    """
+    total = values.sum()
+    weights = values / total
+    hhi = (weights * weights).sum()
+    top_weight = weights.max()
+    stock_value = (values * is_stock).sum()
+    bond_value = (values * is_bond).sum()
+    return total, weights, hhi, top_weight, stock_value, bond_value
+
+
+try:
+    from numba import njit
+
+    _portfolio_kernel = njit(cache=True, fastmath=True)(_portfolio_kernel)
+except ImportError:
+    # Numba is optional; NumPy alone is fine for typical portfolio sizes.
+    pass
+
 
 class PortfolioAgent:
     """Analyze a basic ticker->USD portfolio without external data."""
@@ -26,7 +59,7 @@ class PortfolioAgent:
     def run(self, user_message: str) -> AgentResponse:
         # Expect the incoming string to be a JSON object of ticker -> dollar value.
         try:
-            raw = json.loads(user_message)
+            raw = orjson.loads(user_message)
         except Exception:
             return self._error_response(
                 "Please provide JSON like {\"AAPL\": 5000, \"VTI\": 8000}."
@@ -87,21 +120,32 @@ class PortfolioAgent:
            - Otherwise → low.
         5) Build a sorted list of allocations for display.
         """
-        total = sum(holdings.values())
-
-        # Weight is the share of each position relative to the total portfolio.
-        weights: Dict[str, float] = {k: v / total for k, v in holdings.items()}
+        n = len(holdings)
+        tickers = list(holdings)
+        values = np.fromiter(holdings.values(), dtype=np.float64, count=n)
+        # Bool masks so the kernel never touches Python strings; tickers
+        # are already normalized by _sanitize_holdings.
+        is_stock = np.fromiter(
+            (ASSET_CLASS.get(t) == "stock" for t in tickers), dtype=np.bool_, count=n
+        )
+        is_bond = np.fromiter(
+            (ASSET_CLASS.get(t) == "bond" for t in tickers), dtype=np.bool_, count=n
+        )
 
-        # Herfindahl–Hirschman Index (HHI): higher = more concentrated.
-        hhi = sum(w ** 2 for w in weights.values())
+        total, weights, hhi, top_weight, stock_value, bond_value = _portfolio_kernel(
+            values, is_stock, is_bond
+        )
+        total = float(total)
+        hhi = float(hhi)
+        top_weight = float(top_weight)
+        stock_value = float(stock_value)
+        bond_value = float(bond_value)
+        other_value = total - stock_value - bond_value
 
         # Convert concentration into an easy-to-read 0–100 diversification score.
         diversification_score = max(0.0, min((1 - hhi) * 100, 100.0))
         diversification_score = round(diversification_score, 1)
 
-        n = len(weights)
-        top_weight = max(weights.values()) if weights else 0.0
-
         triggers = []
         # Heuristic risk bands based on concentration and breadth.
         if n < 3 or top_weight > 0.60 or hhi > 0.35:
@@ -125,22 +169,11 @@ class PortfolioAgent:
             triggers.append("no single outsized position")
 
         # Prepare allocations sorted by largest weight first for readability.
-        allocations: List[Tuple[str, float, float]] = sorted(
-            [(ticker, weights[ticker], holdings[ticker]) for ticker in weights],
-            key=lambda x: x[1],
-            reverse=True,
-        )
-
-        # Approximate asset mix using common ticker patterns.
-        stock_value = bond_value = other_value = 0.0
-        for t, v in holdings.items():
-            t_up = t.upper().strip()
-            if t_up in STOCK_KEYWORDS:
-                stock_value += v
-            elif t_up in BOND_KEYWORDS:
-                bond_value += v
-            else:
-                other_value += v
+        # Stable argsort on negated weights matches sorted(..., reverse=True).
+        order = np.argsort(-weights, kind="stable")
+        allocations: List[Tuple[str, float, float]] = [
+            (tickers[i], float(weights[i]), float(values[i])) for i in order
+        ]
 
         stock_pct = stock_value / total * 100 if total else 0.0
         bond_pct = bond_value / total * 100 if total else 0.0
@@ -193,31 +226,36 @@ class PortfolioAgent:
 
         trigger_text = ", ".join(triggers) if triggers else "No major trigger identified"
 
-        lines = []
-        lines.append("### Portfolio Summary")
-        lines.append("")
-        lines.append(f"**Total portfolio value:** ${total:,.2f}")
-        lines.append("")
-        lines.append("**Allocation breakdown**")
-        lines.append("")
-        lines.append("| Ticker | Weight | Value |")
-        lines.append("|---|---:|---:|")
-        for ticker, weight, value in allocations:
-            lines.append(f"| {ticker} | {weight*100:.1f}% | ${value:,.2f} |")
-        lines.append("")
-        lines.append("**Risk and diversification**")
-        lines.append(f"- Diversification score: **{diversification_score} / 100**")
-        lines.append(f"- Risk level: **{str(risk).capitalize()}**")
-        lines.append(f"- Primary reason: {', '.join(reasons)}")
-        lines.append(f"- Triggers: {trigger_text}")
-        lines.append("")
-        lines.append("**Asset mix (approx.)**")
-        lines.append(f"- Stocks: **{stock_pct:.0f}%**")
-        lines.append(f"- Bonds: **{bond_pct:.0f}%**")
-        lines.append(f"- Other: **{other_pct:.0f}%**")
-        lines.append("")
-        lines.append(f"_Disclaimer: {DISCLAIMER}_")
-        return "\n".join(lines)
+        # Only the table body varies in length; everything else is one
+        # f-string template, so no line-list build + join per call.
+        allocation_rows = "\n".join(
+            f"| {ticker} | {weight*100:.1f}% | ${value:,.2f} |"
+            for ticker, weight, value in allocations
+        )
+        return (
+            "### Portfolio Summary\n"
+            "\n"
+            f"**Total portfolio value:** ${total:,.2f}\n"
+            "\n"
+            "**Allocation breakdown**\n"
+            "\n"
+            "| Ticker | Weight | Value |\n"
+            "|---|---:|---:|\n"
+            f"{allocation_rows}\n"
+            "\n"
+            "**Risk and diversification**\n"
+            f"- Diversification score: **{diversification_score} / 100**\n"
+            f"- Risk level: **{str(risk).capitalize()}**\n"
+            f"- Primary reason: {', '.join(reasons)}\n"
+            f"- Triggers: {trigger_text}\n"
+            "\n"
+            "**Asset mix (approx.)**\n"
+            f"- Stocks: **{stock_pct:.0f}%**\n"
+            f"- Bonds: **{bond_pct:.0f}%**\n"
+            f"- Other: **{other_pct:.0f}%**\n"
+            "\n"
+            f"_Disclaimer: {DISCLAIMER}_"
+        )
 
     def _error_response(self, message: str) -> AgentResponse:
         answer = message
@@ -1,23 +1,55 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict
 
+def _prefetch_files(file_paths: List[Path]) -> None:
+    """Hint the kernel to read every file ahead of the actual reads.
+
+    On Linux, posix_fadvise(WILLNEED) queues readahead for all files in
+    one quick pass, so the batch of reads that follows is served from the
+    page cache instead of paying per-file disk latency. No-op elsewhere.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for file_path in file_paths:
+        try:
+            fd = os.open(file_path, os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            finally:
+                os.close(fd)
+        except OSError:
+            # Prefetch is best-effort; the real read will surface errors.
+            continue
+
+def _read_document(file_path: Path) -> Dict:
+    """Read a single text file into the document dict shape."""
+    return {
+        "text": file_path.read_text(encoding="utf-8"),
+        "source": file_path.stem
+    }
+
 def load_documents(data_dir: str = "documents/articles") -> List[Dict]:
     """
     Load text documents from a specified directory.
 
     Args:
-        directory_path (str): The path to the directory containing text files.  
+        directory_path (str): The path to the directory containing text files.
     Returns:
         List[Dict]: A list of dictionaries, each containing the filename and content of a text file.
     """
-    documents = []
-    for file_path in Path(data_dir).glob("*.txt"):
-        text = file_path.read_text(encoding="utf-8")
-        documents.append({
-            "text": text,
-            "source": file_path.stem
-        })
-    return documents
+    file_paths = list(Path(data_dir).glob("*.txt"))
+    if not file_paths:
+        return []
+
+    _prefetch_files(file_paths)
+
+    # Reads are I/O-bound and release the GIL, so a thread pool overlaps
+    # the per-file syscall latency. executor.map preserves input order.
+    max_workers = min(32, (os.cpu_count() or 1) * 4, len(file_paths))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_read_document, file_paths))
 
 def chunk_text(text: str, chunk_size: int = 500, overlap: int = 50) -> List[str]:
     """
@@ -31,13 +63,8 @@ def chunk_text(text: str, chunk_size: int = 500, overlap: int = 50) -> List[str]
     Returns:
         List[str]: A list of text chunks.
     """
-    chunks = []
-    start = 0
-    text_length = len(text)
-    
-    while start < text_length:
-        end = min(start + chunk_size, text_length)
-        chunks.append(text[start:end])
-        start += chunk_size - overlap
-    
-    return chunks
\ No newline at end of file
+    # Single comprehension over precomputed starts: slices clip to the end
+    # of the string on their own, so there is no per-chunk min() or
+    # end-of-text bookkeeping in the loop.
+    step = chunk_size - overlap
+    return [text[start:start + chunk_size] for start in range(0, len(text), step)]
\ No newline at end of file
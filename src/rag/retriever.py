@@ -1,20 +1,91 @@
+import asyncio
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import faiss
+
 from src.rag.loader import load_documents, chunk_text
-from openai import OpenAI
 from src.rag.vector_store import VectorStore
-import numpy as np
+
 class Retriever:
     def __init__(self):
         self.store = VectorStore()
         self._build_Index()
-        
+
     def _build_Index(self):
         documents = load_documents()
         chunks = []
         for doc in documents:
             new_chunks = chunk_text(doc["text"])
             chunks.extend(new_chunks)
+
+        # With RAG_CACHE_DIR set, a previously built index is reloaded
+        # from disk when the corpus is unchanged, skipping the whole
+        # re-embedding pass (thousands of API calls per process start).
+        cache_dir = os.environ.get("RAG_CACHE_DIR")
+        if cache_dir and self._load_cached_index(Path(cache_dir), chunks):
+            return
+
         self.store.build(chunks)
-        
+
+        if cache_dir:
+            self._save_index(Path(cache_dir), chunks)
+
+    def _corpus_hash(self, chunks: list[str]) -> str:
+        h = hashlib.blake2b()
+        for chunk in chunks:
+            h.update(chunk.encode("utf-8"))
+            h.update(b"\x1f")
+        return h.hexdigest()
+
+    def _load_cached_index(self, cache_dir: Path, chunks: list[str]) -> bool:
+        """Reload the serialized index; False means a rebuild is needed."""
+        index_path = cache_dir / "index.faiss"
+        chunks_path = cache_dir / "chunks.json"
+        hash_path = cache_dir / "corpus.hash"
+        if not (index_path.exists() and chunks_path.exists() and hash_path.exists()):
+            return False
+        if hash_path.read_text() != self._corpus_hash(chunks):
+            return False
+
+        try:
+            try:
+                # mmap the vectors instead of copying them onto the heap;
+                # not every index type supports it, so fall back to a
+                # regular read.
+                index = faiss.read_index(str(index_path), faiss.IO_FLAG_MMAP)
+            except RuntimeError:
+                index = faiss.read_index(str(index_path))
+            text_chunks = json.loads(chunks_path.read_text(encoding="utf-8"))
+        except Exception:
+            # A corrupt cache should never block startup; just rebuild.
+            return False
+
+        self.store.index = index
+        self.store.text_chunks = text_chunks
+        return True
+
+    def _save_index(self, cache_dir: Path, chunks: list[str]) -> None:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        faiss.write_index(self.store.index, str(cache_dir / "index.faiss"))
+        (cache_dir / "chunks.json").write_text(
+            json.dumps(self.store.text_chunks), encoding="utf-8"
+        )
+        (cache_dir / "corpus.hash").write_text(self._corpus_hash(chunks))
+
     def retrieve(self, query:  str, top_k: int = 5) -> list[str]:
         return self.store.search(query, top_k)
-    
\ No newline at end of file
+
+    def retrieve_many(self, queries: list[str], top_k: int = 5) -> list[list[str]]:
+        """Retrieve chunks for several queries in one batched search."""
+        return self.store.search_many(queries, top_k)
+
+    def retrieve_by_vector(self, vector, top_k: int = 5) -> list[str]:
+        """Retrieve chunks for an already-embedded, normalized query vector."""
+        return self.store.search_by_vector(vector, top_k)
+
+    async def aretrieve(self, query: str, top_k: int = 5) -> list[str]:
+        """Async wrapper: runs the blocking retrieve on a worker thread."""
+        return await asyncio.to_thread(self.retrieve, query, top_k)
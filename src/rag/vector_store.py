@@ -1,23 +1,82 @@
+import base64
+import functools
+import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import faiss
+import openai
 from openai import OpenAI
 import numpy as np
 
+from src.utils.embedding_cache import EmbeddingCache
+
+# Inputs per embeddings request: keeps each call comfortably inside the
+# OpenAI per-request token limit while still amortizing the round-trip.
+EMBED_BATCH_SIZE = 128
+
+# Concurrent embedding requests in flight during build: enough to
+# overlap the ~400ms API round-trips without tripping rate limits.
+_EMBED_MAX_WORKERS = 5
+
+# Retry-with-backoff settings for rate-limited embedding calls.
+_EMBED_MAX_RETRIES = 5
+_EMBED_BACKOFF_SECONDS = 1.0
+
 class VectorStore:
     
-    def __init__(self, model: str = "text-embedding-3-small"):
+    def __init__(self, model: str = "text-embedding-3-small", index_type: str | None = None):
         """
         Initialize the vector store.
-        
+
         Args:
             model: The OpenAI model to use for creating embeddings
+            index_type: "hnsw" (default) for sublinear graph search, or
+                "flat" for exact brute force — still the better choice on
+                very small corpora. Overridable via RAG_INDEX_TYPE.
         """
-        self.model = model  
-        
+        self.model = model
+
         self.index = None
         self.text_chunks = []
-        
+        self.index_type = (index_type or os.getenv("RAG_INDEX_TYPE", "hnsw")).lower()
+
         self.client = OpenAI()
 
+        # FAISS defaults its OpenMP pool to every logical core, which
+        # oversubscribes hyperthreaded machines and starves the rest of
+        # the process. Size it to physical cores (overridable via env).
+        threads = int(os.getenv("FAISS_OMP_THREADS", 0)) or max(1, (os.cpu_count() or 2) // 2)
+        faiss.omp_set_num_threads(threads)
+
+        # Same opt-in switch as the serialized index: with RAG_CACHE_DIR
+        # set, chunk embeddings persist across runs so only new/changed
+        # chunks are sent to the API.
+        cache_dir = os.environ.get("RAG_CACHE_DIR")
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+            self._embedding_cache = EmbeddingCache(os.path.join(cache_dir, "embeddings.db"))
+        else:
+            self._embedding_cache = None
+
+    def _make_index(self, dimension: int) -> faiss.Index:
+        """Create the configured FAISS index over inner-product scores."""
+        if self.index_type == "flat":
+            # fp16 scalar quantization halves the memory the exact scan
+            # has to stream per query; text-embedding-3-small loses
+            # negligible recall at half precision.
+            return faiss.IndexScalarQuantizer(
+                dimension, faiss.ScalarQuantizer.QT_fp16, faiss.METRIC_INNER_PRODUCT
+            )
+
+        # HNSW graph search touches O(log N) vectors per query instead of
+        # scanning all of them; 32 neighbours per node and efConstruction
+        # 80 are the usual recall/speed sweet spot.
+        index = faiss.IndexHNSWFlat(dimension, 32, faiss.METRIC_INNER_PRODUCT)
+        index.hnsw.efConstruction = 80
+        return index
+
     def embed(self, texts: list[str]) -> list[np.ndarray]:
         """
         Convert text into embeddings (lists of numbers that represent meaning).
@@ -28,37 +87,156 @@ class VectorStore:
         Returns:
             A list of embeddings (numpy arrays), one for each input text
         """
-        # Send texts to OpenAI to get embeddings
-        response = self.client.embeddings.create(
-            input=texts,
-            model=self.model
-        )
-        
-        # Extract just the embedding arrays from the response
-        # This loops through each embedding object and pulls out the .embedding property
-        return [e.embedding for e in response.data]
-    
+        # Send texts to OpenAI to get embeddings (with rate-limit retries)
+        embedded = self._embed_batch(texts)
+
+        # Return one float32 vector per input text
+        return list(embedded)
+
+    def _embed_batch(self, texts: list[str], out: np.ndarray | None = None) -> np.ndarray:
+        """Embed one batch of texts, resolving what it can from the
+        on-disk cache and calling the API only for the misses.
+
+        Rows are written into ``out`` when given (a view into a larger
+        preallocated matrix), so build never materializes an intermediate
+        copy per batch. Returns the (len(texts), D) float32 matrix.
+        """
+        cache = self._embedding_cache
+        if cache is None:
+            return self._embed_batch_api(texts, out)
+
+        cached_rows: list = [None] * len(texts)
+        miss_indices = []
+        for i, text in enumerate(texts):
+            cached = cache.get(self.model, text)
+            if cached is None:
+                miss_indices.append(i)
+            else:
+                cached_rows[i] = cached
+
+        fetched = None
+        if miss_indices:
+            miss_texts = [texts[i] for i in miss_indices]
+            fetched = self._embed_batch_api(miss_texts)
+            cache.set_many(self.model, miss_texts, fetched)
+
+        if out is None:
+            dimension = fetched.shape[1] if fetched is not None else cached_rows[0].shape[0]
+            out = np.empty((len(texts), dimension), dtype='float32')
+
+        for i, row in enumerate(cached_rows):
+            if row is not None:
+                out[i] = row
+        for j, i in enumerate(miss_indices):
+            out[i] = fetched[j]
+
+        return out
+
+    @functools.lru_cache(maxsize=512)
+    def _embed_query(self, query: str) -> bytes:
+        """Memoized query embedding, as float32 bytes.
+
+        Bytes are hashable (ndarrays are not), which lets lru_cache hold
+        the result; repeat queries skip the ~400ms embedding round-trip.
+        The cache keys include ``self``, which is fine here because the
+        store lives as a process-wide singleton behind the Retriever.
+
+        The vector is L2-normalized before caching so search can use the
+        decoded buffer as-is, with no per-call normalization or copy.
+        """
+        vector = self._embed_batch([query])[:1]
+        faiss.normalize_L2(vector)
+        return vector.tobytes()
+
+    def embed_query(self, query: str) -> np.ndarray:
+        """Memoized, L2-normalized (1, D) query embedding.
+
+        Decodes the cached bytes into a read-only float32 view, so
+        callers that need both a cache lookup and a search (e.g. the
+        FinanceQA semantic cache) share one embedding round-trip.
+        """
+        return np.frombuffer(self._embed_query(query), dtype="float32").reshape(1, -1)
+
+    def _embed_batch_api(self, texts: list[str], out: np.ndarray | None = None) -> np.ndarray:
+        """Embed one batch of texts, retrying with backoff on rate limits.
+
+        Embeddings are requested in base64 and decoded straight into the
+        float32 output matrix (allocated here unless the caller passed
+        one) with np.frombuffer — no ~1536-element Python float list is
+        ever boxed per vector. Returns the (len(texts), D) matrix.
+        """
+        delay = _EMBED_BACKOFF_SECONDS
+        for attempt in range(_EMBED_MAX_RETRIES):
+            try:
+                response = self.client.embeddings.create(
+                    input=texts,
+                    model=self.model,
+                    encoding_format="base64",
+                )
+                break
+            except openai.RateLimitError:
+                if attempt == _EMBED_MAX_RETRIES - 1:
+                    raise
+                time.sleep(delay)
+                delay *= 2
+
+        if out is None:
+            dimension = len(base64.b64decode(response.data[0].embedding)) // 4
+            out = np.empty((len(texts), dimension), dtype='float32')
+        for j, e in enumerate(response.data):
+            out[j] = np.frombuffer(base64.b64decode(e.embedding), dtype=np.float32)
+        return out
+
     def build(self, texts: list[str]):
         """
         Build the vector store from a list of texts.
-        
+
         Args:
             texts: A list of text strings to add to the vector store
         """
-        # Get embeddings for all the texts
-        embeddings = self.embed(texts)
-        
-        dimension = len(embeddings[0])  # Store the embedding size
+        # Embed in fixed-size batches: one giant request can blow the
+        # per-request input limit, so chunk the corpus and write each
+        # batch straight into a pre-allocated float32 matrix.
+        first = self._embed_batch(texts[:EMBED_BATCH_SIZE])
+        dimension = first.shape[1]  # Store the embedding size
+
+        embedding_matrix = np.empty((len(texts), dimension), dtype='float32')
+        embedding_matrix[:first.shape[0]] = first
+
+        def embed_slice(start: int) -> None:
+            # Small jitter spreads out the initial burst of submissions
+            # so concurrent batches don't hit the rate limiter in lockstep.
+            time.sleep(random.uniform(0, 0.05))
+            stop = min(start + EMBED_BATCH_SIZE, len(texts))
+            # Write straight into this batch's slice of the matrix: the
+            # slices are disjoint, so no copy and no lock is needed.
+            self._embed_batch(texts[start:stop], out=embedding_matrix[start:stop])
+
+        # Network round-trips dominate build time, so overlap the
+        # remaining batches with a bounded thread pool; each one fills
+        # its own matrix slice in place, preserving input order.
+        remaining = range(EMBED_BATCH_SIZE, len(texts), EMBED_BATCH_SIZE)
+        if remaining:
+            with ThreadPoolExecutor(max_workers=_EMBED_MAX_WORKERS) as executor:
+                for _ in executor.map(embed_slice, remaining):
+                    pass
+
+        # L2-normalize so inner product equals cosine similarity, the
+        # metric OpenAI embeddings are meant to be compared with.
+        faiss.normalize_L2(embedding_matrix)
 
         # Create a FAISS index - this is like a database optimized for finding similar vectors
-        # IndexFlatL2 uses L2 distance (Euclidean distance) to measure similarity
-        self.index = faiss.IndexFlatL2(dimension)
-        # Convert embeddings to a numpy array of type float32 (required by FAISS)
-        embedding_matrix = np.array(embeddings, dtype='float32')
-        
+        # Inner product on normalized vectors is cosine similarity
+        # (and a cheaper kernel than L2 distance)
+        self.index = self._make_index(dimension)
+
+        # Scalar-quantized indexes need a (trivial) training pass first.
+        if not self.index.is_trained:
+            self.index.train(embedding_matrix)
+
         # Add the embeddings to the FAISS index
         self.index.add(embedding_matrix)
-        
+
         # Store the original texts
         self.text_chunks = texts
 
@@ -73,13 +251,44 @@ class VectorStore:
         Returns:
             A list of the most similar texts
         """
-        query_embedding = self.embed([query])[0]
-        
+        return self.search_by_vector(self.embed_query(query), top_k)
+
+    def search_by_vector(self, vector: np.ndarray, top_k: int = 5) -> list[str]:
+        """Search with an already-embedded, L2-normalized (1, D) vector.
+
+        Lets callers that embedded the query for another purpose (the
+        semantic cache) run retrieval without a second embedding call.
+        """
+        # Widen the HNSW search beam with top_k so recall stays high.
+        if hasattr(self.index, "hnsw"):
+            self.index.hnsw.efSearch = max(32, top_k * 4)
+
         # Search the FAISS index for similar vectors
-        # D = distances, I = indices of the closest matches
-        distances, indices = self.index.search(np.array([query_embedding]).astype("float32"), top_k)
-        
-        # Get the actual text for each matching index
-        # Skip any invalid indices (marked as -1)
-        results = [self.text_chunks[i] for i in indices[0] if i != -1]
-        return results
\ No newline at end of file
+        # D = similarity scores, I = indices of the closest matches
+        distances, indices = self.index.search(vector, top_k)
+
+        # Drop invalid slots (marked -1) with a vectorized mask instead
+        # of a Python-level branch per slot, then map ids to text.
+        ids = indices[0]
+        ids = ids[ids >= 0]
+        return [self.text_chunks[i] for i in ids.tolist()]
+
+    def search_many(self, queries: list[str], top_k: int = 5) -> list[list[str]]:
+        """
+        Batch variant of search: one result list per query.
+
+        All queries go out in a single embedding request and a single
+        batched FAISS search, so the network round-trip is amortized and
+        FAISS can parallelize across the query rows.
+        """
+        matrix = self._embed_batch(queries)
+        faiss.normalize_L2(matrix)
+
+        if hasattr(self.index, "hnsw"):
+            self.index.hnsw.efSearch = max(32, top_k * 4)
+
+        _, indices = self.index.search(matrix, top_k)
+        return [
+            [self.text_chunks[i] for i in row[row >= 0].tolist()]
+            for row in indices
+        ]
\ No newline at end of file
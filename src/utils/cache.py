@@ -1,19 +1,39 @@
-import time
+from collections import OrderedDict
+# Monotonic time can't jump backward on NTP adjustments, so entries
+# never expire early (or late) when the wall clock is corrected.
+from time import monotonic
 from typing import Any
 
+# Drop every expired entry once per this many sets, so long-running
+# sessions don't accumulate dead entries between evictions.
+_SWEEP_INTERVAL = 256
+
 class TTLCache:
-    def __init__(self, ttl: int=1800):
+    def __init__(self, ttl: int=1800, maxsize: int=1024):
         self.ttl = ttl
-        self._store : dict[str, tuple[Any, float]] = {}
+        self.maxsize = maxsize
+        # OrderedDict tracks recency: the most recently used keys live at
+        # the end, so LRU eviction is an O(1) popitem from the front.
+        self._store : OrderedDict[str, tuple[Any, float]] = OrderedDict()
+        self._sets_since_sweep = 0
 
     def set(self, key: str, value: Any):
-        expiry = time.time() + self.ttl
+        expiry = monotonic() + self.ttl
+        if key in self._store:
+            self._store.move_to_end(key)
         self._store[key] = (value, expiry)
+        if len(self._store) > self.maxsize:
+            self._store.popitem(last=False)
+
+        self._sets_since_sweep += 1
+        if self._sets_since_sweep >= _SWEEP_INTERVAL:
+            self._sweep()
 
     def get(self, key: str) -> Any:
         if key in self._store:
             value, expiry = self._store[key]
-            if time.time() < expiry:
+            if monotonic() < expiry:
+                self._store.move_to_end(key)
                 return value
             else:
                 del self._store[key]
@@ -21,4 +41,11 @@ class TTLCache:
 
     def clear(self):
         self._store.clear()
-        
\ No newline at end of file
+        self._sets_since_sweep = 0
+
+    def _sweep(self):
+        now = monotonic()
+        expired = [key for key, (_, expiry) in self._store.items() if expiry <= now]
+        for key in expired:
+            del self._store[key]
+        self._sets_since_sweep = 0
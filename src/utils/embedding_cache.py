@@ -0,0 +1,66 @@
+"""Persistent on-disk cache for OpenAI embeddings.
+
+Entries are keyed by (model, sha256(text)) so unchanged chunks are never
+re-embedded across process restarts; vectors are stored as raw float32
+bytes in a single SQLite table.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+from typing import Iterable, Optional
+
+import numpy as np
+
+
+class EmbeddingCache:
+    """SQLite-backed (model, text) -> embedding vector cache."""
+
+    def __init__(self, path: str):
+        # One connection shared across the embedding worker threads;
+        # sqlite connections are not thread-safe, so every statement runs
+        # under the lock.
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                " model TEXT NOT NULL,"
+                " text_hash TEXT NOT NULL,"
+                " vector BLOB NOT NULL,"
+                " PRIMARY KEY (model, text_hash))"
+            )
+            self._conn.commit()
+
+    def get(self, model: str, text: str) -> Optional[np.ndarray]:
+        """Return the cached float32 vector for ``text``, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT vector FROM embeddings WHERE model = ? AND text_hash = ?",
+                (model, self._hash(text)),
+            ).fetchone()
+        if row is None:
+            return None
+        return np.frombuffer(row[0], dtype=np.float32)
+
+    def set_many(self, model: str, texts: Iterable[str], vectors: Iterable) -> None:
+        """Store one vector per text in a single transaction."""
+        rows = [
+            (model, self._hash(text), np.asarray(vector, dtype=np.float32).tobytes())
+            for text, vector in zip(texts, vectors)
+        ]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings VALUES (?, ?, ?)", rows
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _hash(text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
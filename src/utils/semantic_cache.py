@@ -0,0 +1,106 @@
+"""Semantic cache backed by a FAISS inner-product index.
+
+Stores a value per query embedding; lookups return the value of the
+nearest cached query when its cosine similarity clears a threshold, so
+paraphrased repeats of an already-answered question can skip the
+expensive path entirely.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, List, Optional, Tuple
+
+import faiss
+import numpy as np
+
+# Rebuild the index without expired rows once per this many sets, so a
+# long-lived process doesn't accumulate dead vectors without bound.
+_SWEEP_INTERVAL = 64
+
+
+class SemanticCache:
+    """Nearest-neighbour cache over L2-normalized query embeddings.
+
+    Vectors are normalized before add/search so the inner product the
+    index computes is cosine similarity.
+    """
+
+    def __init__(self, threshold: float = 0.85, ttl: int = 900):
+        """Create an empty cache.
+
+        Parameters
+        ----------
+        threshold : float, default 0.85
+            Minimum cosine similarity for a lookup to count as a hit.
+            This compares query to query, where paraphrases of the same
+            question score well above 0.85 while merely related
+            questions score below it — much stricter than the ~0.4
+            cutoffs used for query-to-document retrieval.
+        ttl : int, default 900
+            Seconds a cached entry stays valid.
+        """
+        self.threshold = threshold
+        self.ttl = ttl
+        # The index is created lazily on first insert so the embedding
+        # dimension does not have to be known up front.
+        self.index: Optional[faiss.Index] = None
+        # One (value, expiry) pair per index row, in insertion order.
+        self._entries: List[Tuple[Any, float]] = []
+        self._sets_since_sweep = 0
+
+    def get(self, vector) -> Any:
+        """Return the cached value nearest to ``vector``, or None on miss."""
+        if self.index is None or self.index.ntotal == 0:
+            return None
+
+        scores, indices = self.index.search(self._normalize(vector), 1)
+        row = int(indices[0][0])
+        if row == -1 or float(scores[0][0]) < self.threshold:
+            return None
+
+        value, expiry = self._entries[row]
+        if time.time() >= expiry:
+            # Expired rows never count as hits; _sweep drops them from
+            # the index periodically.
+            return None
+        return value
+
+    def set(self, vector, value: Any) -> None:
+        """Cache ``value`` under the query embedding ``vector``."""
+        normalized = self._normalize(vector)
+        if self.index is None:
+            self.index = faiss.IndexFlatIP(normalized.shape[1])
+        self.index.add(normalized)
+        self._entries.append((value, time.time() + self.ttl))
+
+        self._sets_since_sweep += 1
+        if self._sets_since_sweep >= _SWEEP_INTERVAL:
+            self._sweep()
+
+    def clear(self) -> None:
+        if self.index is not None:
+            self.index.reset()
+        self._entries.clear()
+        self._sets_since_sweep = 0
+
+    def _sweep(self) -> None:
+        """Drop expired rows and rebuild the index over the live ones."""
+        now = time.time()
+        live = [i for i, (_, expiry) in enumerate(self._entries) if expiry > now]
+        if len(live) != len(self._entries):
+            # The flat index stores the raw vectors, so the live rows can
+            # be reconstructed and re-added without re-embedding anything.
+            matrix = self.index.reconstruct_n(0, self.index.ntotal)
+            self.index.reset()
+            if live:
+                self.index.add(matrix[live])
+            self._entries = [self._entries[i] for i in live]
+        self._sets_since_sweep = 0
+
+    def _normalize(self, vector) -> np.ndarray:
+        # np.array always copies, so read-only inputs (np.frombuffer
+        # views from the store's memoized query path) normalize safely.
+        q = np.array(vector, dtype="float32").reshape(1, -1)
+        faiss.normalize_L2(q)
+        return q
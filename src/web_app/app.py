@@ -2,7 +2,7 @@ import os
 import streamlit as st
 from openai import APIConnectionError, AuthenticationError, OpenAIError
 
-from src.workflow.graph import get_graph
+from src.workflow.graph import get_graph, invoke_route
 
 st.set_page_config(page_title="AI Finance Assistant", page_icon="💰", layout="wide")
 st.title("AI Finance Assistant")
@@ -17,6 +17,12 @@ TAB_FORCED_ROUTE = {
 }
 
 
+@st.cache_resource
+def _graph():
+    """Compiled workflow graph, kept alive across Streamlit reruns."""
+    return get_graph()
+
+
 def init_state() -> None:
     if "messages_by_tab" not in st.session_state:
         st.session_state.messages_by_tab = {tab: [] for tab in TAB_KEYS}
@@ -36,13 +42,14 @@ def render_messages(tab_key: str) -> None:
 
 
 def run_query(tab_key: str, user_input: str) -> dict:
-    payload = {"userMsg": user_input}
     forced_route = TAB_FORCED_ROUTE[tab_key]
-    if forced_route:
-        payload["route"] = forced_route
 
     try:
-        result = get_graph().invoke(payload)
+        if forced_route:
+            # Tabs with a fixed agent skip the graph dispatch entirely.
+            result = invoke_route(forced_route, user_input)
+        else:
+            result = _graph().invoke({"userMsg": user_input})
         return {
             "role": "assistant",
             "content": result.get("answer", ""),
@@ -1,16 +1,18 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
 from functools import lru_cache
+import logging
 import re
 from typing import Any, Dict, List, Literal, Optional, Tuple
 
 from langgraph.graph import END, StateGraph
 
+# Only the lightweight base types are imported eagerly; the agent
+# modules (openai, faiss, yfinance, ...) load lazily inside the
+# factories below so importing the graph stays cheap.
 from src.agents.base import AgentResponse
-from src.agents.goal_agent import GoalAgent
-from src.agents.market_agent import MarketAnalysisAgent
-from src.agents.portfolio_agent import PortfolioAgent
-from src.agents.finance_qa_agent import FinanceQAAgent
+
+logger = logging.getLogger(__name__)
 
 Route = Literal["goal", "market", "portfolio", "finance_qa"]
 
@@ -26,45 +28,92 @@ class GraphState:
     history: List[Tuple[str, AgentResponse]] = field(default_factory=list)
     # You can add more fields here if needed for context or intermediate data.  
 
+# Routing tables compiled/frozen at import so classify_route does no
+# per-call pattern compilation or tuple building.
+_TICKER_ONLY_RE = re.compile(r"\s*\$?[A-Za-z]{1,5}\s*")
+_GOAL_KEYWORDS = ("save", "goal", "expected_annual_return", "target_amount")
+_MARKET_KEYWORDS = ("stock", "price", "market", "quote")
+_PORTFOLIO_KEYWORDS = ("portfolio", "allocation", "diversification", "{")
+
+# Keyword -> route, scanned by one compiled alternation so classifying
+# costs a single linear pass over the message instead of one substring
+# search per keyword. The lookahead keeps overlapping hits visible; the
+# category priority below preserves the original if/elif precedence.
+_KEYWORD_ROUTES: Dict[str, Route] = (
+    {kw: "goal" for kw in _GOAL_KEYWORDS}
+    | {kw: "market" for kw in _MARKET_KEYWORDS}
+    | {kw: "portfolio" for kw in _PORTFOLIO_KEYWORDS}
+)
+_KEYWORD_SCAN_RE = re.compile(
+    "(?=(" + "|".join(re.escape(kw) for kw in _KEYWORD_ROUTES) + "))"
+)
+_ROUTE_PRIORITY: Tuple[Route, ...] = ("goal", "market", "portfolio")
+
 def classify_route(user_message: str) -> Route:
     """Simple keyword-based routing logic to determine which agent to use."""
-    msg = user_message.lower()
-
     # Fast path for ticker-only input (e.g., "AAPL" or "$TSLA").
-    if re.fullmatch(r"\s*\$?[A-Za-z]{1,5}\s*", user_message):
-        print("Routing to MarketAnalysisAgent")
-        return "market"
-
-    if "save" in msg or "goal" in msg or "expected_annual_return" in msg or "target_amount" in msg:
-        print("Routing to GoalAgent")
-        return "goal"
-    elif "stock" in msg or "price" in msg or "market" in msg or "quote" in msg:
-        print("Routing to MarketAnalysisAgent")
-        return "market"
-    elif "portfolio" in msg or "allocation" in msg or "diversification" in msg or "{" in msg:
-        print("Routing to PortfolioAgent")
-        return "portfolio"
+    if _TICKER_ONLY_RE.fullmatch(user_message):
+        route: Route = "market"
     else:
-        print("Routing to FinanceQAAgent")
-        return "finance_qa"
-    
+        msg = user_message.lower()
+        hits = {_KEYWORD_ROUTES[m.group(1)] for m in _KEYWORD_SCAN_RE.finditer(msg)}
+        route = next((r for r in _ROUTE_PRIORITY if r in hits), "finance_qa")
+
+    logger.debug("route=%s", route)
+    return route
+
 
 @lru_cache(maxsize=1)
-def _finance_agent() -> FinanceQAAgent:
+def _finance_agent() -> "FinanceQAAgent":
+    from src.agents.finance_qa_agent import FinanceQAAgent
+
     return FinanceQAAgent()
 
 @lru_cache(maxsize=1)
-def _market_agent() -> MarketAnalysisAgent:
+def _market_agent() -> "MarketAnalysisAgent":
+    from src.agents.market_agent import MarketAnalysisAgent
+
     return MarketAnalysisAgent()
 
 @lru_cache(maxsize=1)
-def _portfolio_agent() -> PortfolioAgent:
+def _portfolio_agent() -> "PortfolioAgent":
+    from src.agents.portfolio_agent import PortfolioAgent
+
     return PortfolioAgent()
 
 @lru_cache(maxsize=1)
-def _goal_agent() -> GoalAgent:
+def _goal_agent() -> "GoalAgent":
+    from src.agents.goal_agent import GoalAgent
+
     return GoalAgent()
 
+# Route -> agent factory, shared by the graph nodes and invoke_route.
+_AGENT_FACTORIES = {
+    "finance_qa": _finance_agent,
+    "market": _market_agent,
+    "portfolio": _portfolio_agent,
+    "goal": _goal_agent,
+}
+
+def _agent_update(response: AgentResponse) -> Dict[str, Any]:
+    """Convert an AgentResponse into a graph state update."""
+    return {
+        "answer": response.answer,
+        "agent_name": response.agent_name,
+        "confidence": response.confidence,
+        "sources": response.sources,
+    }
+
+def invoke_route(route: Route, user_message: str) -> Dict[str, Any]:
+    """Run one agent directly, bypassing the graph and router.
+
+    Callers that already know the route (e.g. the Portfolio/Market/Goals
+    tabs) skip the router node and the LangGraph dispatch entirely.
+    Returns the same dict shape as ``get_graph().invoke``.
+    """
+    response = _AGENT_FACTORIES[route]().run(user_message)
+    return _agent_update(response)
+
 def router_node(state: GraphState) -> Dict[str, Any]:
     """Node to classify the route based on user message."""
     if state.route in ("goal", "market", "portfolio", "finance_qa"):
@@ -75,44 +124,21 @@ def router_node(state: GraphState) -> Dict[str, Any]:
 
 def finance_qa_node(state: GraphState) -> Dict[str, Any]:
     """Node to run the FinanceQAAgent."""
-    response = _finance_agent().run(state.userMsg)
-    return {
-        "answer": response.answer,
-        "agent_name": response.agent_name,
-        "confidence": response.confidence,
-        "sources": response.sources,
-    }
+    return _agent_update(_finance_agent().run(state.userMsg))
 
 def market_node(state: GraphState) -> Dict[str, Any]:
     """Node to run the MarketAnalysisAgent."""
-    response = _market_agent().run(state.userMsg)
-    return {
-        "answer": response.answer,
-        "agent_name": response.agent_name,
-        "confidence": response.confidence,
-        "sources": response.sources,
-    }
-    
+    return _agent_update(_market_agent().run(state.userMsg))
+
 def portfolio_node(state: GraphState) -> Dict[str, Any]:
     """Node to run the PortfolioAgent."""
-    response = _portfolio_agent().run(state.userMsg)
-    return {
-        "answer": response.answer,
-        "agent_name": response.agent_name,
-        "confidence": response.confidence,
-        "sources": response.sources,
-    }
-    
+    return _agent_update(_portfolio_agent().run(state.userMsg))
+
 def goal_node(state: GraphState) -> Dict[str, Any]:
     """Node to run the GoalAgent."""
-    response = _goal_agent().run(state.userMsg)
-    return {
-        "answer": response.answer,
-        "agent_name": response.agent_name,
-        "confidence": response.confidence,
-        "sources": response.sources,
-    }
-    
+    return _agent_update(_goal_agent().run(state.userMsg))
+
+
 #-- Graph Construction --#
 def build_graph():
     graph = StateGraph(GraphState)
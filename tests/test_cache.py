@@ -0,0 +1,38 @@
+from src.utils.cache import TTLCache
+
+
+def test_ttl_cache_get_and_set() -> None:
+    cache = TTLCache(ttl=60)
+    cache.set("AAPL", {"price": 123.45})
+
+    assert cache.get("AAPL") == {"price": 123.45}
+    assert cache.get("MSFT") is None
+
+
+def test_ttl_cache_expired_entry_is_dropped() -> None:
+    cache = TTLCache(ttl=0)
+    cache.set("AAPL", {"price": 123.45})
+
+    assert cache.get("AAPL") is None
+
+
+def test_ttl_cache_evicts_least_recently_used() -> None:
+    cache = TTLCache(ttl=60, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    # Touch "a" so "b" becomes the least recently used entry.
+    assert cache.get("a") == 1
+
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_clear() -> None:
+    cache = TTLCache(ttl=60)
+    cache.set("a", 1)
+    cache.clear()
+
+    assert cache.get("a") is None
@@ -48,6 +48,29 @@ def test_market_agent_contract(monkeypatch) -> None:
     _assert_agent_response_contract(response)
 
 
+def test_market_agent_run_many_contract(monkeypatch) -> None:
+    agent = MarketAnalysisAgent()
+    monkeypatch.setattr(
+        agent,
+        "_download_batch",
+        lambda tickers: {
+            ticker: {
+                "price": 100.0,
+                "day_change_pct": 0.5,
+                "last_5_closes": [98.0, 99.0, 100.0],
+            }
+            for ticker in tickers
+            if ticker != "ZZZZZ"
+        },
+    )
+
+    responses = agent.run_many(["aapl", "MSFT", "ZZZZZ"])
+
+    assert [r.confidence for r in responses] == ["high", "high", "low"]
+    for response in responses:
+        _assert_agent_response_contract(response)
+
+
 def test_finance_qa_agent_contract_without_network() -> None:
     class FakeRetriever:
         def retrieve(self, query: str, top_k: int = 5) -> list[str]:
@@ -57,7 +80,7 @@ def test_finance_qa_agent_contract_without_network() -> None:
         def __init__(self) -> None:
             self.responses = self
 
-        def create(self, **kwargs):
+        async def create(self, **kwargs):
             return SimpleNamespace(output_text="An ETF is a basket of securities.")
 
     # Bypass __init__ to avoid OpenAI and embedding calls in tests.
@@ -0,0 +1,24 @@
+import numpy as np
+
+from src.utils.embedding_cache import EmbeddingCache
+
+
+def test_embedding_cache_roundtrip(tmp_path) -> None:
+    cache = EmbeddingCache(str(tmp_path / "embeddings.db"))
+    vector = np.arange(4, dtype=np.float32)
+
+    cache.set_many("test-model", ["hello"], [vector])
+    fetched = cache.get("test-model", "hello")
+
+    assert fetched is not None
+    assert np.array_equal(fetched, vector)
+    cache.close()
+
+
+def test_embedding_cache_miss_on_other_model_or_text(tmp_path) -> None:
+    cache = EmbeddingCache(str(tmp_path / "embeddings.db"))
+    cache.set_many("test-model", ["hello"], [np.zeros(4, dtype=np.float32)])
+
+    assert cache.get("other-model", "hello") is None
+    assert cache.get("test-model", "goodbye") is None
+    cache.close()
@@ -0,0 +1,32 @@
+from src.rag.loader import chunk_text, load_documents
+
+
+def test_load_documents_reads_txt_files(tmp_path) -> None:
+    (tmp_path / "etf.txt").write_text("ETF basics", encoding="utf-8")
+    (tmp_path / "bonds.txt").write_text("Bond basics", encoding="utf-8")
+    (tmp_path / "ignored.md").write_text("not loaded", encoding="utf-8")
+
+    documents = load_documents(str(tmp_path))
+
+    assert {doc["source"] for doc in documents} == {"etf", "bonds"}
+    assert {doc["text"] for doc in documents} == {"ETF basics", "Bond basics"}
+
+
+def test_load_documents_empty_directory(tmp_path) -> None:
+    assert load_documents(str(tmp_path)) == []
+
+
+def test_chunk_text_windows_and_overlap() -> None:
+    text = "abcdefghij"
+
+    chunks = chunk_text(text, chunk_size=4, overlap=2)
+
+    assert chunks == ["abcd", "cdef", "efgh", "ghij", "ij"]
+
+
+def test_chunk_text_short_text_is_single_chunk() -> None:
+    assert chunk_text("short", chunk_size=500, overlap=50) == ["short"]
+
+
+def test_chunk_text_empty_text_returns_no_chunks() -> None:
+    assert chunk_text("", chunk_size=500, overlap=50) == []
@@ -0,0 +1,49 @@
+import faiss
+import numpy as np
+
+from src.rag.retriever import Retriever
+from src.rag.vector_store import VectorStore
+
+
+def _retriever_with_store() -> Retriever:
+    # Bypass __init__ to avoid OpenAI and embedding calls in tests.
+    retriever = Retriever.__new__(Retriever)
+    retriever.store = VectorStore.__new__(VectorStore)
+    retriever.store.index = None
+    retriever.store.text_chunks = []
+    return retriever
+
+
+def test_index_cache_roundtrip(tmp_path) -> None:
+    chunks = ["alpha", "beta", "gamma", "delta"]
+
+    saver = _retriever_with_store()
+    index = faiss.IndexFlatIP(4)
+    index.add(np.eye(4, dtype="float32"))
+    saver.store.index = index
+    saver.store.text_chunks = chunks
+    saver._save_index(tmp_path, chunks)
+
+    loader = _retriever_with_store()
+    assert loader._load_cached_index(tmp_path, chunks)
+    assert loader.store.text_chunks == chunks
+    assert loader.store.index.ntotal == 4
+
+
+def test_index_cache_rejects_changed_corpus(tmp_path) -> None:
+    chunks = ["alpha", "beta"]
+
+    saver = _retriever_with_store()
+    index = faiss.IndexFlatIP(4)
+    index.add(np.eye(4, dtype="float32")[:2])
+    saver.store.index = index
+    saver.store.text_chunks = chunks
+    saver._save_index(tmp_path, chunks)
+
+    loader = _retriever_with_store()
+    assert not loader._load_cached_index(tmp_path, chunks + ["new chunk"])
+
+
+def test_index_cache_miss_on_empty_dir(tmp_path) -> None:
+    loader = _retriever_with_store()
+    assert not loader._load_cached_index(tmp_path, ["alpha"])